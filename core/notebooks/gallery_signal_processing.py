@@ -172,8 +172,9 @@ impulse.plot()
 # ## Dependence of ema on depth
 
 # %%
-for i in range(1, 6):
-    csigproc.compute_ema(impulse, tau=40, min_periods=20, depth=i).plot()
+csigproc.compute_iterated_emas(
+    impulse, tau=40, min_periods=20, max_depth=5
+).plot()
 
 # %% [markdown]
 # ## Dependence of smooth moving average on max depth
@@ -4,9 +4,9 @@ Import as:
 import core.signal_processing.ema_smoothing as cspremsm
 """
 
-import functools
+import itertools
 import logging
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, Iterator, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -57,14 +57,54 @@ def compute_ema(
     _LOG.debug("width = %0.2f", np.sqrt(depth) * tau)
     _LOG.debug("aspect ratio = %0.2f", np.sqrt(1 + 1.0 / depth))
     _LOG.debug("tau = %0.2f", tau)
+    # Keep only the ema of the requested depth.
+    for signal_hat in _iterate_ema(signal, tau, min_periods, depth):
+        pass
+    return signal_hat
+
+
+def compute_iterated_emas(
+    signal: pd.Series,
+    tau: float,
+    min_periods: int,
+    max_depth: int,
+) -> pd.DataFrame:
+    """
+    Compute `compute_ema()` of `signal` for each depth in `[1, max_depth]`.
+
+    The ema of depth `n` is the ema of the ema of depth `n - 1`, so all the
+    depths are computed with `max_depth` smoothing passes, instead of the
+    `max_depth * (max_depth + 1) / 2` passes needed by calling `compute_ema()`
+    once per depth.
+
+    :return: dataframe with the ema of depth `n` in the column `n`
+    """
+    hdbg.dassert_isinstance(signal, pd.Series)
+    hdbg.dassert_isinstance(max_depth, int)
+    hdbg.dassert_lte(1, max_depth)
+    emas = _iterate_ema(signal, tau, min_periods, max_depth)
+    df = pd.concat(emas, axis=1, keys=range(1, max_depth + 1))
+    return df
+
+
+def _iterate_ema(
+    signal: Union[pd.DataFrame, pd.Series],
+    tau: float,
+    min_periods: int,
+    max_depth: int,
+) -> Iterator[Union[pd.DataFrame, pd.Series]]:
+    """
+    Yield the iterated emas of `signal` of depth `1, ..., max_depth`.
+    """
+    hdbg.dassert_lt(0, tau)
     com = csprspfu.calculate_com_from_tau(tau)
     _LOG.debug("com = %0.2f", com)
     signal_hat = signal.copy()
-    for _ in range(0, depth):
+    for _ in range(0, max_depth):
         signal_hat = signal_hat.ewm(
             com=com, min_periods=min_periods, adjust=True, ignore_na=False, axis=0
         ).mean()
-    return signal_hat
+        yield signal_hat
 
 
 def compute_smooth_derivative(
@@ -145,11 +185,12 @@ def compute_smooth_moving_average(
     hdbg.dassert_lte(min_depth, max_depth)
     range_ = tau * (min_depth + max_depth) / 2.0
     _LOG.debug("Range = %0.2f", range_)
-    ema_eval = functools.partial(compute_ema, signal, tau, min_periods)
     denom = float(max_depth - min_depth + 1)
-    # Not the most efficient implementation, but follows 3.56 of Dacorogna
-    # directly.
-    return sum(map(ema_eval, range(min_depth, max_depth + 1))) / denom
+    # Follow 3.56 of Dacorogna, computing the emas of all the depths with a
+    # single sequence of smoothing passes.
+    emas = _iterate_ema(signal, tau, min_periods, max_depth)
+    emas = itertools.islice(emas, min_depth - 1, None)
+    return sum(emas) / denom
 
 
 def extract_smooth_moving_average_weights(
@@ -5,7 +5,7 @@ import core.signal_processing.incremental_pca as csprinpc
 """
 
 import logging
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -64,42 +64,55 @@ def compute_ipca(
     vs: Dict[int, list] = {k: [] for k in range(num_pc)}
     unit_eigenvecs: Dict[int, list] = {k: [] for k in range(num_pc)}
     step = 0
-    for n in df.index:
-        # Initialize u(n).
-        u = df.loc[n].copy()
-        for i in range(min(num_pc, step + 1)):
-            # Initialize ith eigenvector.
-            if i == step:
-                v = u.copy()
-                if np.linalg.norm(v):
-                    _LOG.debug("Initializing eigenvector %s...", i)
-                    step += 1
-            else:
-                # Main update step for eigenvector i.
-                u, v = _compute_ipca_step(u, vs[i][-1], alpha)
-            # Bookkeeping.
-            v.name = n
-            vs[i].append(v)
-            norm = np.linalg.norm(v)
-            lambdas[i].append(norm)
-            unit_eigenvecs[i].append(v / norm)
+    # Iterate over the rows as numpy arrays, since indexing and operating on
+    # a pandas series at each step dominates the run time. A zero `v` yields
+    # NaN unit eigenvectors, as the pandas division did, without warnings.
+    with np.errstate(invalid="ignore"):
+        for row in df.to_numpy():
+            # Initialize u(n).
+            u = row.copy()
+            for i in range(min(num_pc, step + 1)):
+                # Initialize ith eigenvector.
+                if i == step:
+                    v = u.copy()
+                    if np.linalg.norm(v):
+                        _LOG.debug("Initializing eigenvector %s...", i)
+                        step += 1
+                else:
+                    # Main update step for eigenvector i.
+                    u, v = _compute_ipca_step(u, vs[i][-1], alpha)
+                # Bookkeeping.
+                vs[i].append(v)
+                norm = np.linalg.norm(v)
+                lambdas[i].append(norm)
+                unit_eigenvecs[i].append(v / norm)
     _LOG.debug("Completed %s steps of incremental PCA.", len(df))
     # Convert lambda dict of lists to list of series.
     # Convert unit_eigenvecs dict of lists to list of dataframes.
     lambdas_srs = []
     unit_eigenvec_dfs = []
     for i in range(num_pc):
-        lambdas_srs.append(
-            pd.Series(index=df.index[-len(lambdas[i]) :], data=lambdas[i])
+        # Each eigenvector is estimated from its initialization to the end.
+        idx = df.index[-len(lambdas[i]) :]
+        lambdas_srs.append(pd.Series(index=idx, data=lambdas[i]))
+        # Rebuild the index from its values, without name and `freq`, as when
+        # the dataframe was built from the eigenvector series.
+        unit_eigenvec_dfs.append(
+            pd.DataFrame(
+                np.vstack(unit_eigenvecs[i]),
+                index=pd.Index(idx.to_numpy()),
+                columns=df.columns,
+            )
         )
-        unit_eigenvec_dfs.append(pd.concat(unit_eigenvecs[i], axis=1).transpose())
     lambda_df = pd.concat(lambdas_srs, axis=1)
     return lambda_df, unit_eigenvec_dfs
 
 
 def _compute_ipca_step(
-    u: pd.Series, v: pd.Series, alpha: float
-) -> Tuple[pd.Series, pd.Series]:
+    u: Union[pd.Series, np.ndarray],
+    v: Union[pd.Series, np.ndarray],
+    alpha: float,
+) -> Tuple[Union[pd.Series, np.ndarray], Union[pd.Series, np.ndarray]]:
     """
     Single step of incremental PCA.
 
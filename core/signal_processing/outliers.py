@@ -92,12 +92,9 @@ def process_outliers(
     if min_periods > window:
         _LOG.warning("`min_periods`=`%s` > `window`=`%s`", min_periods, window)
     # Compute bounds.
-    l_bound = srs.rolling(window, min_periods=min_periods, center=False).quantile(
-        lower_quantile
-    )
-    u_bound = srs.rolling(window, min_periods=min_periods, center=False).quantile(
-        upper_quantile
-    )
+    rolling = srs.rolling(window, min_periods=min_periods, center=False)
+    l_bound = rolling.quantile(lower_quantile)
+    u_bound = rolling.quantile(upper_quantile)
     _LOG.debug(
         "Removing outliers in [%s, %s] with mode=%s",
         lower_quantile,
@@ -115,23 +112,22 @@ def process_outliers(
         info["num_infs_before"] = np.isinf(srs).sum()
         info["quantiles"] = (lower_quantile, upper_quantile)
         info["mode"] = mode
-    #
-    srs = srs.copy()
     # Here we implement the functions instead of using library functions (e.g,
     # `scipy.stats.mstats.winsorize`) since we want to compute some statistics
     # that are not readily available from the library function.
     l_mask = srs < l_bound
     u_mask = u_bound < srs
+    # The following operations return a new series, so the input is not
+    # modified.
     if mode == "winsorize":
         # Assign the outliers to the value of the bounds.
-        srs[l_mask] = l_bound[l_mask]
-        srs[u_mask] = u_bound[u_mask]
+        srs = srs.mask(l_mask, l_bound).mask(u_mask, u_bound)
     else:
         mask = u_mask | l_mask
         if mode == "set_to_nan":
-            srs[mask] = np.nan
+            srs = srs.mask(mask, np.nan)
         elif mode == "set_to_zero":
-            srs[mask] = 0.0
+            srs = srs.mask(mask, 0.0)
         else:
             hdbg.dfatal("Invalid mode='%s'" % mode)
     # Append more the stats.
@@ -27,6 +27,28 @@ class Test_compute_smooth_derivative1(hunitest.TestCase):
         self.check_string(actual.to_string())
 
 
+class Test_compute_iterated_emas1(hunitest.TestCase):
+    def test1(self) -> None:
+        """
+        Check that each column matches `compute_ema()` with the same depth.
+        """
+        np.random.seed(42)
+        tau = 40
+        min_periods = 20
+        max_depth = 5
+        n = 1000
+        signal = pd.Series(np.random.randn(n))
+        actual = cspremsm.compute_iterated_emas(
+            signal, tau, min_periods, max_depth
+        )
+        self.assertEqual(actual.columns.to_list(), [1, 2, 3, 4, 5])
+        for depth in actual.columns:
+            expected = cspremsm.compute_ema(signal, tau, min_periods, depth)
+            pd.testing.assert_series_equal(
+                actual[depth], expected, check_names=False
+            )
+
+
 class Test_compute_smooth_moving_average1(hunitest.TestCase):
     def test1(self) -> None:
         np.random.seed(42)
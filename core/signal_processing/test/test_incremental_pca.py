@@ -123,6 +123,26 @@ class Test_compute_ipca(hunitest.TestCase):
         )
         self.check_string(txt)
 
+    def test7(self) -> None:
+        """
+        Test the index of the unit eigenvector dataframes.
+        """
+        df = self._get_df(seed=1)
+        self.assertIsNotNone(df.index.freq)
+        num_pc = 3
+        tau = 16
+        _, unit_eigenvec_dfs = csprinpc.compute_ipca(df, num_pc, tau)
+        for unit_eigenvec_df in unit_eigenvec_dfs:
+            # The index does not keep the `freq` of the input index.
+            self.assertIsInstance(unit_eigenvec_df.index, pd.DatetimeIndex)
+            self.assertIsNone(unit_eigenvec_df.index.freq)
+            self.assertIsNone(unit_eigenvec_df.index.name)
+            self.assertTrue(
+                unit_eigenvec_df.index.equals(
+                    df.index[-len(unit_eigenvec_df) :]
+                )
+            )
+
     @staticmethod
     def _get_df(seed: int) -> pd.DataFrame:
         """
@@ -810,8 +810,14 @@ def preprocess_multiindex_cols(
         "Dataframe multiindex column depth incompatible with config.",
     )
     # Select single-column-level dataframe and return.
-    df_out = df.sort_index(axis=1)
-    df_out = df_out[col_group].copy()
+    if df.columns.is_monotonic_increasing:
+        # Copy only the selected columns, rather than sorting (and thus
+        # copying) the entire dataframe.
+        df_out = df[col_group].copy()
+    else:
+        # Sorting already returns a copy, so the selection is not shared with
+        # `df`.
+        df_out = df.sort_index(axis=1)[col_group]
     return df_out
 
 
@@ -1,6 +1,8 @@
 import datetime
 import logging
+import unittest.mock as umock
 
+import joblib
 import numpy as np
 import pandas as pd
 import sklearn.decomposition as sdecom
@@ -75,6 +77,125 @@ class TestUnsupervisedSkLearnModel(hunitest.TestCase):
         )
         self.assert_equal(actual, expected)
 
+    def test4(self) -> None:
+        """
+        Test `fit()` without collecting the output dataframe info.
+        """
+        data = self._get_data()
+        config = cconfig.Config.from_dict(
+            {
+                "x_vars": [0, 1, 2, 3],
+                "model_func": sdecom.PCA,
+                "model_kwargs": {"n_components": 2},
+                "collect_df_out_info": False,
+            }
+        )
+        node = dtfcnuskmo.UnsupervisedSkLearnModel("sklearn", **config.to_dict())
+        node.fit(data)
+        info = node.get_info("fit")
+        self.assertIn("model_attributes", info)
+        self.assertNotIn("df_out_info", info)
+
+    def test5(self) -> None:
+        """
+        Test that `predict()` with `memory` is not stale after a refit.
+        """
+        data = self._get_data()
+        fit_df1 = data.loc["2000-01-03":"2000-01-31"]  # type: ignore[misc]
+        fit_df2 = data.loc["2000-01-17":"2000-02-11"]  # type: ignore[misc]
+        predict_df = data.loc["2000-02-01":"2000-02-25"]  # type: ignore[misc]
+        memory = joblib.Memory(self.get_scratch_space(), verbose=0)
+        node = dtfcnuskmo.UnsupervisedSkLearnModel(
+            "sklearn",
+            model_func=sdecom.PCA,
+            model_kwargs={"n_components": 2},
+            memory=memory,
+        )
+        node.fit(fit_df1)
+        df_out1 = node.predict(predict_df)["df_out"]
+        # Refit on different data with the same cache.
+        node.fit(fit_df2)
+        actual = node.predict(predict_df)["df_out"]
+        # Compare against a node without cache.
+        expected_node = dtfcnuskmo.UnsupervisedSkLearnModel(
+            "sklearn", model_func=sdecom.PCA, model_kwargs={"n_components": 2}
+        )
+        expected_node.fit(fit_df2)
+        expected = expected_node.predict(predict_df)["df_out"]
+        pd.testing.assert_frame_equal(actual, expected)
+        self.assertFalse(actual.equals(df_out1))
+        # Clearing the cache does not change the output.
+        node.clear_cache()
+        actual = node.predict(predict_df)["df_out"]
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test6(self) -> None:
+        """
+        Test `fit()` and `predict()` with `dtype=np.float32`.
+        """
+        data = self._get_data()
+        fit_df = data.loc["2000-01-03":"2000-01-31"]  # type: ignore[misc]
+        predict_df = data.loc["2000-02-01":"2000-02-25"]  # type: ignore[misc]
+        dfs_out = {}
+        for dtype in [np.float32, None]:
+            node = dtfcnuskmo.UnsupervisedSkLearnModel(
+                "sklearn",
+                model_func=sdecom.PCA,
+                model_kwargs={"n_components": 2},
+                dtype=dtype,
+            )
+            node.fit(fit_df)
+            dfs_out[dtype] = node.predict(predict_df)["df_out"]
+        actual = dfs_out[np.float32]
+        expected = dfs_out[None]
+        self.assertTrue((actual.dtypes == np.float32).all())
+        self.assertTrue((expected.dtypes == np.float64).all())
+        pd.testing.assert_frame_equal(
+            actual, expected, check_dtype=False, atol=1e-5, rtol=1e-4
+        )
+
+    def test7(self) -> None:
+        """
+        Test that an invalid `nan_mode` is rejected at construction.
+        """
+        with self.assertRaises(AssertionError):
+            dtfcnuskmo.UnsupervisedSkLearnModel(
+                "sklearn", model_func=sdecom.PCA, nan_mode="fill"
+            )
+
+    def test8(self) -> None:
+        """
+        Test that `predict()` with `memory` reuses the cached transformation.
+        """
+        data = self._get_data()
+        fit_df = data.loc["2000-01-03":"2000-01-31"]  # type: ignore[misc]
+        predict_df = data.loc["2000-02-01":"2000-02-25"]  # type: ignore[misc]
+        memory = joblib.Memory(self.get_scratch_space(), verbose=0)
+        node = dtfcnuskmo.UnsupervisedSkLearnModel(
+            "sklearn",
+            model_func=sdecom.PCA,
+            model_kwargs={"n_components": 2},
+            memory=memory,
+        )
+        node.fit(fit_df)
+        with umock.patch.object(
+            sdecom.PCA,
+            "transform",
+            autospec=True,
+            side_effect=sdecom.PCA.transform,
+        ) as transform:
+            expected = node.predict(predict_df)["df_out"]
+            self.assertEqual(transform.call_count, 1)
+            # Predicting on the same data hits the cache.
+            actual = node.predict(predict_df)["df_out"]
+            self.assertEqual(transform.call_count, 1)
+            pd.testing.assert_frame_equal(actual, expected)
+            # Refitting invalidates the cached transformations.
+            node.fit(fit_df)
+            self.assertEqual(transform.call_count, 2)
+            node.predict(predict_df)
+            self.assertEqual(transform.call_count, 3)
+
     def _get_data(self) -> pd.DataFrame:
         """
         Generate multivariate normal returns.
@@ -213,6 +334,29 @@ class TestResidualizer(hunitest.TestCase):
         )
         self.assert_equal(actual, expected)
 
+    def test4(self) -> None:
+        """
+        Test that `fit()` does not overwrite the data kept by the model.
+        """
+
+        class _PCA(sdecom.PCA):
+            """
+            PCA keeping a reference to its training data.
+            """
+
+            def fit(self, X, y=None):  # type: ignore[no-untyped-def]
+                self.X_fit_ = X
+                self.X_fit_copy_ = X.copy()
+                return super().fit(X, y)
+
+        data = self.get_data()
+        node_kwargs = self.get_node_config().to_dict()
+        node_kwargs["model_func"] = _PCA
+        node = dtfcnuskmo.Residualizer("sklearn", **node_kwargs)
+        node.fit(data)
+        model = node.get_fit_state()["_model"]
+        np.testing.assert_array_equal(model.X_fit_, model.X_fit_copy_)
+
     def get_data(self) -> pd.DataFrame:
         """
         Generate multivariate normal returns.
@@ -369,4 +513,33 @@ class TestResidualizer2(hunitest.TestCase):
                 "nan_mode": "drop",
             }
         )
-        return config
\ No newline at end of file
+        return config
+
+
+class Test_batch_fit(hunitest.TestCase):
+    def test1(self) -> None:
+        """
+        Test that fitting nodes in parallel matches fitting them serially.
+        """
+        mn_process = carsigen.MultivariateNormalProcess()
+        mn_process.set_cov_from_inv_wishart_draw(dim=4, seed=0)
+        data = mn_process.generate_sample(
+            {"start": "2000-01-01", "periods": 40, "freq": "B"}, seed=0
+        )
+        nodes = []
+        expected = {}
+        for n_components in [1, 2, 3]:
+            nid = f"pca{n_components}"
+            model_kwargs = {"n_components": n_components}
+            node = dtfcnuskmo.UnsupervisedSkLearnModel(
+                nid, model_func=sdecom.PCA, model_kwargs=model_kwargs
+            )
+            nodes.append(node)
+            serial_node = dtfcnuskmo.UnsupervisedSkLearnModel(
+                nid, model_func=sdecom.PCA, model_kwargs=model_kwargs
+            )
+            expected[nid] = serial_node.fit(data)["df_out"]
+        actual = dtfcnuskmo.batch_fit(nodes, data, n_jobs=2)
+        self.assertEqual(list(actual.keys()), list(expected.keys()))
+        for nid, df_out in expected.items():
+            pd.testing.assert_frame_equal(actual[nid]["df_out"], df_out)
@@ -6,8 +6,10 @@ import dataflow.core.nodes.unsupervised_sklearn_models as dtfcnuskmo
 
 import collections
 import logging
-from typing import Any, Callable, Dict, Optional, Tuple
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import joblib
 import numpy as np
 import pandas as pd
 import sklearn.impute as skimput
@@ -20,8 +22,42 @@ import helpers.hdbg as hdbg
 
 _LOG = logging.getLogger(__name__)
 
+# Valid values for `nan_mode`. They are checked at construction, so an invalid
+# value raises `AssertionError` in `__init__()` instead of `ValueError` in
+# `fit()`.
+_NAN_MODES = ["raise", "drop"]
+
+
+class _SkLearnModelInfoMixin:
+    def _get_model_info(
+        self,
+    ) -> Tuple[Dict[str, Any], collections.OrderedDict]:
+        """
+        Return the params and the attributes of the fitted model.
+
+        The model is not modified after `fit()`, so the info is computed once
+        and reused until the model is refit or its fit state is set.
+        """
+        if self._model_info is None:
+            model_attribute_info = collections.OrderedDict()
+            for k, v in vars(self._model).items():
+                model_attribute_info[k] = v
+            self._model_info = (self._model.get_params(), model_attribute_info)
+        return self._model_info
+
+
+class _UnsupervisedSkLearnModelMixin(_SkLearnModelInfoMixin):
+    def clear_cache(self) -> None:
+        """
+        Clear the transformations cached in `memory`, if any.
+
+        The cache is keyed on the `_transform()` function in the `memory`
+        location, so this clears the cached transformations of all the nodes
+        sharing the same location, not only the ones of this node.
+        """
+        if self._memory is not None:
+            self._memory.cache(_transform, ignore=["model"]).clear(warn=False)
 
-class _UnsupervisedSkLearnModelMixin:
     def _fit_predict_unsupervised_sklearn_model(
         self, df_in: pd.DataFrame, fit: bool = False
     ) -> Tuple[pd.DataFrame, collections.OrderedDict]:
@@ -33,32 +69,42 @@ class _UnsupervisedSkLearnModelMixin:
         :return: transformed df_in
         """
         dtfcorutil.validate_df_indices(df_in)
-        df = df_in.copy()
         # Determine index where no x_vars are NaN.
-        x_vars = df.columns.tolist()
-        non_nan_idx = df.dropna().index
+        x_vars = df_in.columns.tolist()
+        non_nan_idx = _get_non_nan_idx(df_in, x_vars)
         hdbg.dassert(not non_nan_idx.empty)
         # Handle presence of NaNs according to `nan_mode`.
-        _handle_nans(self._nan_mode, df.index, non_nan_idx)
+        _handle_nans(self._nan_mode, df_in.index, non_nan_idx)
         # Prepare x_vars in sklearn format.
-        x_fit = cdatadap.transform_to_sklearn(df.loc[non_nan_idx], x_vars)
+        x_fit = _to_sklearn(df_in, non_nan_idx, x_vars, self._dtype)
         if fit:
             # Define and fit model.
             self._model = self._model_func(**self._model_kwargs)
             self._model = self._model.fit(x_fit)
+            self._model_info = None
+            # Use a random token rather than a counter, since the cache on disk
+            # outlives the node.
+            self._model_token = uuid.uuid4().hex
         # Generate insample transformations and put in dataflow dataframe format.
-        x_transform = self._model.transform(x_fit)
-        #
-        num_cols = x_transform.shape[1]
-        x_hat = cdatadap.transform_from_sklearn(
-            non_nan_idx, list(range(num_cols)), x_transform
+        if self._memory is None:
+            x_transform = self._model.transform(x_fit)
+        else:
+            # Reuse the transformation computed for identical data by the same
+            # fitted model.
+            x_transform = self._memory.cache(_transform, ignore=["model"])(
+                self._model, self._model_token, x_fit
+            )
+        # Build the output directly, since the transformed columns are just
+        # labeled with their position.
+        x_hat = pd.DataFrame(
+            x_transform,
+            index=non_nan_idx,
+            columns=pd.RangeIndex(x_transform.shape[1]),
         )
         info = collections.OrderedDict()
         info["model_x_vars"] = x_vars
-        info["model_params"] = self._model.get_params()
-        model_attribute_info = collections.OrderedDict()
-        for k, v in vars(self._model).items():
-            model_attribute_info[k] = v
+        model_params, model_attribute_info = self._get_model_info()
+        info["model_params"] = model_params
         info["model_attributes"] = model_attribute_info
         # Return targets and predictions.
         df_out = x_hat.reindex(index=df_in.index)
@@ -83,6 +129,9 @@ class UnsupervisedSkLearnModel(
         model_kwargs: Optional[Any] = None,
         col_mode: Optional[str] = None,
         nan_mode: Optional[str] = None,
+        collect_df_out_info: bool = True,
+        dtype: Optional[np.dtype] = None,
+        memory: Optional[joblib.Memory] = None,
     ) -> None:
         """
         Specify the data and sklearn modeling parameters.
@@ -92,14 +141,36 @@ class UnsupervisedSkLearnModel(
         :param x_vars: indexed by knowledge datetimes
         :param model_kwargs: parameters to forward to the sklearn model
             (e.g., regularization constants)
+        :param collect_df_out_info: whether to store a summary of `df_out` in
+            the node info. Computing it requires a scan of all the columns, so
+            it can be disabled when the info is not consumed
+        :param dtype: dtype of the data passed to the model, e.g., `np.float32`
+            halves the memory traffic at the cost of precision. `None` keeps the
+            dtype of the input data
+        :param memory: cache the transformations of the fitted model, e.g., to
+            avoid recomputing them when `predict()` is called repeatedly on the
+            same data. Cached results are looked up by hashing the data, so
+            caching pays off only if the transformation is more expensive than
+            that. `None` disables caching
         """
         super().__init__(nid)
         self._model_func = model_func
         self._model_kwargs = model_kwargs or {}
+        # Validate `x_vars` once, unless it is a callable that can be resolved
+        # only at graph execution.
+        if isinstance(x_vars, list):
+            x_vars = dtfcorutil.convert_to_list(x_vars)
         self._x_vars = x_vars
         self._model = None
+        self._model_info = None
         self._col_mode = col_mode or "replace_all"
         self._nan_mode = nan_mode or "raise"
+        hdbg.dassert_in(self._nan_mode, _NAN_MODES)
+        self._collect_df_out_info = collect_df_out_info
+        self._dtype = dtype
+        self._memory = memory
+        # Identify the fitted model in the keys of the cached transformations.
+        self._model_token: Optional[str] = None
 
     def fit(self, df_in: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         return self._fit_predict_helper(df_in, fit=True)
@@ -113,6 +184,8 @@ class UnsupervisedSkLearnModel(
 
     def set_fit_state(self, fit_state: Dict[str, Any]):
         self._model = fit_state["_model"]
+        self._model_info = None
+        self._model_token = uuid.uuid4().hex
         self._info["fit"] = fit_state["_info['fit']"]
 
     def _fit_predict_helper(
@@ -123,7 +196,8 @@ class UnsupervisedSkLearnModel(
         df_out = self._apply_col_mode(
             df_in, df_out, cols=df.columns.to_list(), col_mode=self._col_mode
         )
-        info["df_out_info"] = dtfcorutil.get_df_info_as_string(df_out)
+        if self._collect_df_out_info:
+            info["df_out_info"] = dtfcorutil.get_df_info_as_string(df_out)
         method = "fit" if fit else "predict"
         self._set_info(method, info)
         return {"df_out": df_out}
@@ -131,9 +205,13 @@ class UnsupervisedSkLearnModel(
     def _preprocess_df(self, df_in):
         if self._x_vars is None:
             x_vars = df_in.columns.tolist()
+        elif isinstance(self._x_vars, list):
+            x_vars = self._x_vars
         else:
             x_vars = dtfcorutil.convert_to_list(self._x_vars)
-        return df_in[x_vars].copy()
+        # Selecting the columns already returns a new dataframe, so there is no
+        # need to copy it.
+        return df_in[x_vars]
 
 
 class MultiindexUnsupervisedSkLearnModel(
@@ -152,6 +230,9 @@ class MultiindexUnsupervisedSkLearnModel(
         model_func: Callable[..., Any],
         model_kwargs: Optional[Any] = None,
         nan_mode: Optional[str] = None,
+        collect_df_out_info: bool = True,
+        dtype: Optional[np.dtype] = None,
+        memory: Optional[joblib.Memory] = None,
     ) -> None:
         """
         Specify the data and sklearn modeling parameters.
@@ -164,9 +245,22 @@ class MultiindexUnsupervisedSkLearnModel(
         :param out_col_group: new output col group names. This specifies the
             names of the first N - 1 levels. The leaf_cols names remain the
             same.
-        :param model_func: an sklearn model
+        :param model_func: an sklearn model, or any model with the same
+            `fit()` / `transform()` interface (e.g., a GPU-backed drop-in
+            replacement for large inputs)
         :param model_kwargs: parameters to forward to the sklearn model
             (e.g., regularization constants)
+        :param collect_df_out_info: whether to store a summary of `df_out` in
+            the node info. Computing it requires a scan of all the columns, so
+            it can be disabled when the info is not consumed
+        :param dtype: dtype of the data passed to the model, e.g., `np.float32`
+            halves the memory traffic at the cost of precision. `None` keeps the
+            dtype of the input data
+        :param memory: cache the transformations of the fitted model, e.g., to
+            avoid recomputing them when `predict()` is called repeatedly on the
+            same data. Cached results are looked up by hashing the data, so
+            caching pays off only if the transformation is more expensive than
+            that. `None` disables caching
         """
         super().__init__(nid)
         hdbg.dassert_isinstance(in_col_group, tuple)
@@ -181,7 +275,14 @@ class MultiindexUnsupervisedSkLearnModel(
         self._model_func = model_func
         self._model_kwargs = model_kwargs or {}
         self._model = None
+        self._model_info = None
         self._nan_mode = nan_mode or "raise"
+        hdbg.dassert_in(self._nan_mode, _NAN_MODES)
+        self._collect_df_out_info = collect_df_out_info
+        self._dtype = dtype
+        self._memory = memory
+        # Identify the fitted model in the keys of the cached transformations.
+        self._model_token: Optional[str] = None
 
     def fit(self, df_in: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         return self._fit_predict_helper(df_in, fit=True)
@@ -195,6 +296,8 @@ class MultiindexUnsupervisedSkLearnModel(
 
     def set_fit_state(self, fit_state: Dict[str, Any]):
         self._model = fit_state["_model"]
+        self._model_info = None
+        self._model_token = uuid.uuid4().hex
         self._info["fit"] = fit_state["_info['fit']"]
 
     def _fit_predict_helper(
@@ -210,13 +313,14 @@ class MultiindexUnsupervisedSkLearnModel(
             out_dfs,
         )
         df_out = dtfcorutil.merge_dataframes(df_in, df_out)
-        info["df_out_info"] = dtfcorutil.get_df_info_as_string(df_out)
+        if self._collect_df_out_info:
+            info["df_out_info"] = dtfcorutil.get_df_info_as_string(df_out)
         method = "fit" if fit else "predict"
         self._set_info(method, info)
         return {"df_out": df_out}
 
 
-class _ResidualizerMixin:
+class _ResidualizerMixin(_SkLearnModelInfoMixin):
     def _fit_predict_residualizer(
         self,
         df_in: pd.DataFrame,
@@ -230,10 +334,9 @@ class _ResidualizerMixin:
         :return: transformed df_in
         """
         dtfcorutil.validate_df_indices(df_in)
-        df = df_in.copy()
         # Determine index where no x_vars are NaN.
-        x_vars = df.columns.to_list()
-        all_nan_cols_srs = df.isna().all()
+        x_vars = df_in.columns.to_list()
+        all_nan_cols_srs = df_in.isna().all()
         # If a column has all-NaNs, then impute the values. This behavior makes
         # the model more robust to universe jitter. If the number of all-NaN
         # columns is large as a percentage of the columns, performance will
@@ -245,15 +348,17 @@ class _ResidualizerMixin:
                 "Fraction of all-NaN columns exceeds %f." % all_nan_col_threshold
             )
         # Drop rows with all NaNs.
-        non_nan_idx = df[x_vars].dropna(how="all").index
+        non_nan_idx = df_in[x_vars].dropna(how="all").index
         hdbg.dassert(
             not non_nan_idx.empty,
             "There are no non-NaN indices available for training.",
         )
         # Handle presence of NaNs according to `nan_mode`.
-        _handle_nans(self._nan_mode, df.index, non_nan_idx)
+        _handle_nans(self._nan_mode, df_in.index, non_nan_idx)
         # Prepare x_vars in sklearn format.
-        x_fit = cdatadap.transform_to_sklearn(df.loc[non_nan_idx], x_vars)
+        x_fit = cdatadap.transform_to_sklearn(df_in.loc[non_nan_idx], x_vars)
+        if self._dtype is not None:
+            x_fit = x_fit.astype(self._dtype, copy=False)
         # Impute NaNs cross-sectionally (row-wise).
         imputer = skimput.SimpleImputer(missing_values=np.nan, strategy="mean")
         x_fit = np.transpose(imputer.fit_transform(np.transpose(x_fit)))
@@ -261,19 +366,19 @@ class _ResidualizerMixin:
             # Define and fit model.
             self._model = self._model_func(**self._model_kwargs)
             self._model = self._model.fit(x_fit)
+            self._model_info = None
         # Generate insample transformations and put in dataflow dataframe format.
         x_transform = self._model.transform(x_fit)
         x_hat = self._model.inverse_transform(x_transform)
-        #
+        # Do not compute the residual in place, since the model may keep a
+        # reference to `x_fit` (e.g., its training data).
         x_residual = cdatadap.transform_from_sklearn(
             non_nan_idx, x_vars, x_fit - x_hat
         )
         info = collections.OrderedDict()
         info["model_x_vars"] = x_vars
-        info["model_params"] = self._model.get_params()
-        model_attribute_info = collections.OrderedDict()
-        for k, v in vars(self._model).items():
-            model_attribute_info[k] = v
+        model_params, model_attribute_info = self._get_model_info()
+        info["model_params"] = model_params
         info["model_attributes"] = model_attribute_info
         df_out = x_residual.reindex(index=df_in.index)
         return df_out, info
@@ -292,6 +397,8 @@ class Residualizer(dtfconobas.FitPredictNode, _ResidualizerMixin):
         model_func: Callable[..., Any],
         model_kwargs: Optional[Any] = None,
         nan_mode: Optional[str] = None,
+        collect_df_out_info: bool = True,
+        dtype: Optional[np.dtype] = None,
     ) -> None:
         """
         Specify the data and sklearn modeling parameters.
@@ -300,6 +407,12 @@ class Residualizer(dtfconobas.FitPredictNode, _ResidualizerMixin):
         :param model_func: an sklearn model
         :param model_kwargs: parameters to forward to the sklearn model
             (e.g., regularization constants)
+        :param collect_df_out_info: whether to store a summary of `df_out` in
+            the node info. Computing it requires a scan of all the columns, so
+            it can be disabled when the info is not consumed
+        :param dtype: dtype of the data passed to the model, e.g., `np.float32`
+            halves the memory traffic at the cost of precision. `None` keeps the
+            dtype of the input data
         """
         super().__init__(nid)
         self._in_col_group = in_col_group
@@ -307,7 +420,11 @@ class Residualizer(dtfconobas.FitPredictNode, _ResidualizerMixin):
         self._model_func = model_func
         self._model_kwargs = model_kwargs or {}
         self._model = None
+        self._model_info = None
         self._nan_mode = nan_mode or "raise"
+        hdbg.dassert_in(self._nan_mode, _NAN_MODES)
+        self._collect_df_out_info = collect_df_out_info
+        self._dtype = dtype
 
     def fit(self, df_in: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         return self._fit_predict_helper(df_in, fit=True)
@@ -321,6 +438,7 @@ class Residualizer(dtfconobas.FitPredictNode, _ResidualizerMixin):
 
     def set_fit_state(self, fit_state: Dict[str, Any]):
         self._model = fit_state["_model"]
+        self._model_info = None
         self._info["fit"] = fit_state["_info['fit']"]
 
     def _fit_predict_helper(
@@ -336,14 +454,17 @@ class Residualizer(dtfconobas.FitPredictNode, _ResidualizerMixin):
             out_dfs,
         )
         df_out = dtfcorutil.merge_dataframes(df_in, df_out)
-        info["df_out_info"] = dtfcorutil.get_df_info_as_string(df_out)
+        if self._collect_df_out_info:
+            info["df_out_info"] = dtfcorutil.get_df_info_as_string(df_out)
         method = "fit" if fit else "predict"
         self._set_info(method, info)
         return {"df_out": df_out}
 
 
 class SkLearnInverseTransformer(
-    dtfconobas.FitPredictNode, dtfconobas.ColModeMixin
+    dtfconobas.FitPredictNode,
+    dtfconobas.ColModeMixin,
+    _SkLearnModelInfoMixin,
 ):
     """
     Inverse transform cols using an unsupervised sklearn model.
@@ -360,6 +481,8 @@ class SkLearnInverseTransformer(
         model_kwargs: Optional[Any] = None,
         col_mode: Optional[str] = None,
         nan_mode: Optional[str] = None,
+        collect_df_out_info: bool = True,
+        dtype: Optional[np.dtype] = None,
     ) -> None:
         """
         Specify the data and sklearn modeling parameters.
@@ -372,6 +495,12 @@ class SkLearnInverseTransformer(
         :param trans_x_vars: the cols to apply the learned inverse transform to
         :param model_kwargs: parameters to forward to the sklearn model
             (e.g., regularization constants)
+        :param collect_df_out_info: whether to store a summary of `df_out` in
+            the node info. Computing it requires a scan of all the columns, so
+            it can be disabled when the info is not consumed
+        :param dtype: dtype of the data passed to the model, e.g., `np.float32`
+            halves the memory traffic at the cost of precision. `None` keeps the
+            dtype of the input data
         """
         super().__init__(nid)
         self._model_func = model_func
@@ -380,9 +509,13 @@ class SkLearnInverseTransformer(
         self._trans_x_vars = dtfcorutil.convert_to_list(trans_x_vars)
         hdbg.dassert_not_intersection(self._x_vars, self._trans_x_vars)
         self._model = None
+        self._model_info = None
         self._col_mode = col_mode or "replace_all"
         hdbg.dassert_in(self._col_mode, ["replace_all", "merge_all"])
         self._nan_mode = nan_mode or "raise"
+        hdbg.dassert_in(self._nan_mode, _NAN_MODES)
+        self._collect_df_out_info = collect_df_out_info
+        self._dtype = dtype
 
     def fit(self, df_in: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         return self._fit_predict_helper(df_in, fit=True)
@@ -396,6 +529,7 @@ class SkLearnInverseTransformer(
 
     def set_fit_state(self, fit_state: Dict[str, Any]):
         self._model = fit_state["_model"]
+        self._model_info = None
         self._info["fit"] = fit_state["_info['fit']"]
 
     def _fit_predict_helper(
@@ -409,36 +543,34 @@ class SkLearnInverseTransformer(
         :return: transformed df_in
         """
         dtfcorutil.validate_df_indices(df_in)
-        df = df_in.copy()
         # Determine index where no x_vars are NaN.
-        x_vars = dtfcorutil.convert_to_list(self._x_vars)
-        non_nan_idx = df[x_vars].dropna().index
+        x_vars = self._x_vars
+        non_nan_idx = _get_non_nan_idx(df_in, x_vars)
         hdbg.dassert(not non_nan_idx.empty)
         # Handle presence of NaNs according to `nan_mode`.
-        _handle_nans(self._nan_mode, df.index, non_nan_idx)
+        _handle_nans(self._nan_mode, df_in.index, non_nan_idx)
         # Prepare x_vars in sklearn format.
-        x_fit = cdatadap.transform_to_sklearn(df.loc[non_nan_idx], x_vars)
+        x_fit = _to_sklearn(df_in, non_nan_idx, x_vars, self._dtype)
         if fit:
             # Define and fit model.
             self._model = self._model_func(**self._model_kwargs)
             self._model = self._model.fit(x_fit)
+            self._model_info = None
         # Add info on unsupervised model.
         info = collections.OrderedDict()
         info["model_x_vars"] = x_vars
-        info["model_params"] = self._model.get_params()
-        model_attribute_info = collections.OrderedDict()
-        for k, v in vars(self._model).items():
-            model_attribute_info[k] = v
+        model_params, model_attribute_info = self._get_model_info()
+        info["model_params"] = model_params
         info["model_attributes"] = model_attribute_info
         # Determine index where no trans_x_vars are NaN.
-        trans_x_vars = dtfcorutil.convert_to_list(self._trans_x_vars)
-        trans_non_nan_idx = df[trans_x_vars].dropna().index
+        trans_x_vars = self._trans_x_vars
+        trans_non_nan_idx = _get_non_nan_idx(df_in, trans_x_vars)
         hdbg.dassert(not trans_non_nan_idx.empty)
         # Handle presence of NaNs according to `nan_mode`.
-        _handle_nans(self._nan_mode, df.index, trans_non_nan_idx)
+        _handle_nans(self._nan_mode, df_in.index, trans_non_nan_idx)
         # Prepare trans_x_vars in sklearn format.
-        trans_x_fit = cdatadap.transform_to_sklearn(
-            df.loc[non_nan_idx], trans_x_vars
+        trans_x_fit = _to_sklearn(
+            df_in, non_nan_idx, trans_x_vars, self._dtype
         )
         trans_x_inv_trans = self._model.inverse_transform(trans_x_fit)
         trans_x_inv_trans = cdatadap.transform_from_sklearn(
@@ -447,9 +579,10 @@ class SkLearnInverseTransformer(
         #
         df_out = trans_x_inv_trans.reindex(index=df_in.index)
         df_out = self._apply_col_mode(
-            df, df_out, cols=trans_x_vars, col_mode=self._col_mode
+            df_in, df_out, cols=trans_x_vars, col_mode=self._col_mode
         )
-        info["df_out_info"] = dtfcorutil.get_df_info_as_string(df_out)
+        if self._collect_df_out_info:
+            info["df_out_info"] = dtfcorutil.get_df_info_as_string(df_out)
         if fit:
             self._set_info("fit", info)
         else:
@@ -458,14 +591,90 @@ class SkLearnInverseTransformer(
         return {"df_out": df_out}
 
 
+def batch_fit(
+    nodes: List[dtfconobas.FitPredictNode],
+    df_in: pd.DataFrame,
+    n_jobs: int = -1,
+) -> Dict[dtfcornode.NodeId, Dict[str, pd.DataFrame]]:
+    """
+    Fit independent nodes on the same data in parallel.
+
+    The nodes are fit in threads, since the fit state is stored in the node
+    objects and it would be lost if the nodes were fit in other processes.
+    Fitting sklearn models is dominated by BLAS calls that release the GIL.
+    BLAS is multi-threaded as well, so consider limiting its threads (e.g.,
+    with `OMP_NUM_THREADS`) to avoid oversubscribing the cores.
+
+    :param nodes: nodes to fit, which must not depend on each other
+    :param df_in: data to fit all the nodes on
+    :param n_jobs: number of threads, where `-1` means using all the cores
+    :return: output of `fit()` keyed by node id
+    """
+    hdbg.dassert_isinstance(nodes, list)
+    hdbg.dassert_no_duplicates([node.nid for node in nodes])
+    outputs = joblib.Parallel(n_jobs=n_jobs, backend="threading")(
+        joblib.delayed(node.fit)(df_in) for node in nodes
+    )
+    return {node.nid: output for node, output in zip(nodes, outputs)}
+
+
+def _to_sklearn(
+    df: pd.DataFrame,
+    idx: pd.Index,
+    cols: List[Any],
+    dtype: Optional[np.dtype] = None,
+) -> np.ndarray:
+    """
+    Extract the values of `cols` at `idx` in the format expected by sklearn.
+
+    The memory layout of the values is left unchanged, since sklearn and BLAS
+    handle both C and Fortran order.
+
+    :param dtype: dtype to cast the values to, or `None` to keep it unchanged
+    """
+    x_vals = cdatadap.transform_to_sklearn(df.loc[idx], cols)
+    if dtype is not None:
+        x_vals = x_vals.astype(dtype, copy=False)
+    return x_vals
+
+
+def _transform(
+    model: Any, model_token: str, x_vals: np.ndarray
+) -> np.ndarray:
+    """
+    Apply a fitted sklearn model to `x_vals`.
+
+    This is a module-level function so that `joblib.Memory` can cache it.
+    `model` is excluded from the cache key, since hashing a fitted model is
+    expensive, and `model_token` identifies it instead.
+    """
+    _ = model_token
+    return model.transform(x_vals)
+
+
+def _get_non_nan_idx(df: pd.DataFrame, cols: List[Any]) -> pd.Index:
+    """
+    Return the index of the rows of `df` where none of `cols` is NaN.
+
+    For float data the mask is computed directly on the numpy values, which
+    avoids materializing the intermediate dataframe built by `dropna()`.
+    """
+    vals = df[cols].to_numpy(copy=False)
+    if vals.dtype.kind not in "fc":
+        return df[cols].dropna().index
+    mask = ~np.isnan(vals).any(axis=1)
+    return df.index[mask]
+
+
 def _handle_nans(
     nan_mode: str, idx: pd.DataFrame.index, non_nan_idx: pd.DataFrame.index
 ) -> None:
-    if nan_mode == "raise":
-        if idx.shape[0] != non_nan_idx.shape[0]:
-            nan_idx = idx.difference(non_nan_idx)
-            raise ValueError(f"NaNs detected at {nan_idx}")
-    elif nan_mode == "drop":
-        pass
-    else:
-        raise ValueError(f"Unrecognized nan_mode `{nan_mode}`")
\ No newline at end of file
+    # `nan_mode` is validated at construction, so for "drop" there is nothing
+    # to do.
+    if nan_mode != "raise":
+        return
+    # Compute the NaN index only in the error path, since the set difference is
+    # expensive for large indices.
+    if idx.shape[0] != non_nan_idx.shape[0]:
+        nan_idx = idx.difference(non_nan_idx)
+        raise ValueError(f"NaNs detected at {nan_idx}")
\ No newline at end of file
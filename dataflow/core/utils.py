@@ -159,12 +159,9 @@ def merge_dataframes(
         df2.columns.nlevels,
         msg="Column hierarchy depth must be equal.",
     )
-    df = df2.merge(
-        df1,
-        how="outer",
-        left_index=True,
-        right_index=True,
-    )
+    # Since the indices are identical, we can concatenate the columns directly
+    # instead of performing an outer merge, which needs to join the indices.
+    df = pd.concat([df2, df1], axis=1)
     return df
 
 
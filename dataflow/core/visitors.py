@@ -23,13 +23,15 @@ NodeInfo = Dict[dtfcornode.NodeId, Dict[dtfcornode.Method, Any]]
 
 
 def extract_info(
-    dag: dtfcordag.DAG, methods: List[dtfcornode.Method]
+    dag: dtfcordag.DAG, methods: List[dtfcornode.Method], deep: bool = False
 ) -> NodeInfo:
     """
     Extract node info from each DAG node.
 
     :param dag: dataflow DAG. Node info is populated upon running.
     :param methods: `Node` method infos to extract
+    :param deep: return a deep copy of the info, instead of references to the
+        info stored in the nodes, which the client should not modify
     :return: nested `OrderedDict`
     """
     hdbg.dassert_isinstance(dag, dtfcordag.DAG)
@@ -42,11 +44,12 @@ def extract_info(
         node = dag.get_node(nid)
         # Extract the info for each method.
         for method in methods:
-            method_info = node.get_info(method)
-            node_info[method] = copy.copy(method_info)
-        # TODO(gp): Not sure about the double copy. Maybe a single deepcopy is
-        # enough.
-        info[nid] = copy.copy(node_info)
+            node_info[method] = node.get_info(method)
+        info[nid] = node_info
+    if deep:
+        # A shallow copy doesn't isolate the nested info, so we do a single
+        # deep copy when the client needs an independent copy.
+        info = copy.deepcopy(info)
     return info  # type: ignore
 
 
@@ -72,8 +75,9 @@ def get_fit_state(dag: dtfcordag.DAG) -> NodeState:
         node = dag.get_node(nid)
         # Save the info for the fit state.
         hdbg.dassert_isinstance(node, dtfconobas.FitPredictNode)
-        node_fit_state = node.get_fit_state()
-        fit_state[nid] = copy.copy(node_fit_state)
+        # The state is owned by the node and treated as opaque by the clients,
+        # so there is no need to copy it.
+        fit_state[nid] = node.get_fit_state()
     return fit_state
 
 
@@ -95,5 +99,4 @@ def set_fit_state(dag: dtfcordag.DAG, fit_state: NodeState) -> None:
         # Set the info for the fit state.
         hdbg.dassert_isinstance(node, dtfconobas.FitPredictNode)
         hdbg.dassert_in(nid, fit_state.keys())
-        node_fit_state = copy.copy(fit_state[nid])
-        node.set_fit_state(node_fit_state)
\ No newline at end of file
+        node.set_fit_state(fit_state[nid])
\ No newline at end of file
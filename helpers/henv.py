@@ -291,7 +291,18 @@ def _git_log(num_commits: int = 5, my_commits: bool = False) -> str:
 # End copy.
 
 
+@functools.lru_cache()
 def get_system_signature(git_commit_type: str = "all") -> Tuple[str, int]:
+    """
+    Return a description of the Git client, the machine, and the packages.
+
+    The signature is computed once per process and then cached, since it
+    requires running several shell commands and importing many packages.
+    Thus the dynamic info (e.g., memory and disk usage) refers to the first
+    call.
+
+    :return: signature and number of packages that failed to import
+    """
     # TODO(gp): This should return a string that we append to the rest.
     container_dir_name = "."
     hversio.check_version(container_dir_name)
@@ -75,5 +75,7 @@ class S3Mock_TestCase(hunitest.TestCase):
         # Stop moto.
         self.mock_aws_credentials_patch.stop()
         self.mock_s3.stop()
+        # Do not reuse the filesystem created while S3 was mocked.
+        hs3.clear_s3fs_cache()
         # Deallocate in reverse order to avoid race conditions.
         super().tearDown()
\ No newline at end of file
@@ -5,23 +5,19 @@ import helpers.hs3 as hs3
 """
 
 import argparse
+import concurrent.futures
 import configparser
 import copy
-import functools
 import gzip
 import logging
 import os
 import pathlib
-import pprint
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-_WARNING = "\033[33mWARNING\033[0m"
-
-try:
+# `s3fs` is imported only by the functions that use it, since importing it is
+# slow and many clients of this module never access S3.
+if TYPE_CHECKING:
     import s3fs
-except ModuleNotFoundError:
-    _module = "s3fs"
-    print(_WARNING + f": Can't find {_module}: continuing")
 
 # Avoid the following dependency from other `helpers` modules to prevent import cycles.
 # import helpers.hpandas as hpandas
@@ -47,7 +43,7 @@ _LOG = logging.getLogger(__name__)
 # Basic utils.
 # #############################################################################
 
-AwsProfile = Optional[Union[str, s3fs.core.S3FileSystem]]
+AwsProfile = Optional[Union[str, "s3fs.core.S3FileSystem"]]
 
 
 def is_s3_path(s3_path: str) -> bool:
@@ -55,9 +51,10 @@ def is_s3_path(s3_path: str) -> bool:
     Return whether a path is on an S3 bucket, i.e., if it starts with `s3://`.
     """
     hdbg.dassert_isinstance(s3_path, str)
-    valid = s3_path.startswith("s3://")
-    if s3_path.startswith("s3://s3://"):
-        valid = False
+    # Check for a repeated prefix only for paths that look like S3 paths.
+    valid = s3_path.startswith("s3://") and not s3_path.startswith(
+        "s3://s3://"
+    )
     return valid
 
 
@@ -328,9 +325,51 @@ def from_file(
     return data
 
 
+def parallel_get(
+    file_name: str,
+    aws_profile: AwsProfile,
+    *,
+    part_size: int = 8 * 1024**2,
+    num_threads: int = 8,
+) -> bytearray:
+    """
+    Read the content of an S3 file issuing concurrent ranged requests.
+
+    Splitting a large file in parts that are downloaded in parallel is
+    faster than reading it through a single stream.
+
+    :param file_name: full S3 path starting with `s3://`
+    :param aws_profile: the name of an AWS profile or a s3fs filesystem
+    :param part_size: size in bytes of each requested part
+    :param num_threads: max number of parts requested at the same time
+    :return: the content of the file
+    """
+    dassert_is_s3_path(file_name)
+    hdbg.dassert_lt(0, part_size)
+    hdbg.dassert_lte(1, num_threads)
+    s3fs_ = get_s3fs(aws_profile)
+    size = s3fs_.info(file_name)["size"]
+    # Write each part directly at its offset in the output buffer.
+    data = bytearray(size)
+    data_view = memoryview(data)
+
+    def _get_part(start: int) -> None:
+        end = min(start + part_size, size)
+        # Use the public `fsspec` API, which works both with the sync and the
+        # async versions of `s3fs`, unlike the underlying boto client.
+        data_view[start:end] = s3fs_.cat_file(file_name, start=start, end=end)
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=num_threads
+    ) as executor:
+        # Consume the results to propagate any exception.
+        list(executor.map(_get_part, range(0, size, part_size)))
+    return data
+
+
 def get_local_or_s3_stream(
     file_name: str, **kwargs: Any
-) -> Tuple[Union[s3fs.core.S3FileSystem, str], Any]:
+) -> Tuple[Union["s3fs.core.S3FileSystem", str], Any]:
     """
     Get S3 stream for desired file or simply returns file name.
 
@@ -345,10 +384,17 @@ def get_local_or_s3_stream(
             kwargs,
             "Credentials through s3fs are needed to access an S3 path",
         )
+        import s3fs
+
         s3fs_ = kwargs.pop("s3fs")
         hdbg.dassert_isinstance(s3fs_, s3fs.core.S3FileSystem)
-        dassert_path_exists(file_name, s3fs_)
-        stream = s3fs_.open(file_name)
+        # Opening a file already fetches its metadata from S3, so we don't
+        # check that the path exists beforehand, which would issue another
+        # request for every file.
+        try:
+            stream = s3fs_.open(file_name)
+        except FileNotFoundError:
+            hdbg.dfatal(f"S3 path '{file_name}' doesn't exist!")
     else:
         if "s3fs" in kwargs:
             _LOG.warning("Passed `s3fs` without an S3 file: ignoring it")
@@ -364,6 +410,10 @@ def get_local_or_s3_stream(
 
 
 # TODO(Nikola): CmTask #1810 "Increase test coverage in helpers/hs3.py"
+# Map an AWS profile to its S3 bucket, which is resolved only once per process.
+_S3_BUCKET_CACHE: Dict[str, str] = {}
+
+
 def get_s3_bucket_path(aws_profile: str, add_s3_prefix: bool = True) -> str:
     """
     Return the S3 bucket from environment variable corresponding to a given
@@ -373,6 +423,19 @@ def get_s3_bucket_path(aws_profile: str, add_s3_prefix: bool = True) -> str:
     is usually set to `s3://alphamatic-data`.
     """
     hdbg.dassert_type_is(aws_profile, str)
+    s3_bucket = _S3_BUCKET_CACHE.get(aws_profile)
+    if s3_bucket is None:
+        s3_bucket = _get_s3_bucket(aws_profile)
+        _S3_BUCKET_CACHE[aws_profile] = s3_bucket
+    if add_s3_prefix:
+        s3_bucket = "s3://" + s3_bucket
+    return s3_bucket
+
+
+def _get_s3_bucket(aws_profile: str) -> str:
+    """
+    Resolve the S3 bucket for `aws_profile`, without the `s3://` prefix.
+    """
     prefix = aws_profile.upper()
     env_var = f"{prefix}_AWS_S3_BUCKET"
     if env_var in os.environ:
@@ -382,7 +445,7 @@ def get_s3_bucket_path(aws_profile: str, add_s3_prefix: bool = True) -> str:
         # Fall-back to local credentials.
         _LOG.debug("Checking credentials")
         aws_credentials = get_aws_credentials(aws_profile)
-        _LOG.debug("%s", aws_credentials)
+        _LOG.debug("Got AWS credentials=%s", list(aws_credentials.keys()))
         s3_bucket = aws_credentials.get("aws_s3_bucket", "")
     hdbg.dassert_ne(s3_bucket, "")
     hdbg.dassert(
@@ -391,8 +454,6 @@ def get_s3_bucket_path(aws_profile: str, add_s3_prefix: bool = True) -> str:
         env_var,
         s3_bucket,
     )
-    if add_s3_prefix:
-        s3_bucket = "s3://" + s3_bucket
     return s3_bucket
 
 
@@ -460,16 +521,28 @@ def get_aws_profile(aws_profile: str) -> str:
     return os.environ[env_var]
 
 
+# Map the path of an AWS config file to its modification time and its parsed
+# config.
+_AWS_CONFIG_CACHE: Dict[str, Tuple[float, configparser.RawConfigParser]] = {}
+
+
 def _get_aws_config(file_name: str) -> configparser.RawConfigParser:
     """
     Return a parser to the config in `~/.aws/{file_name]}`.
+
+    The parsed config is cached and re-read only if the file was modified.
     """
     file_name = os.path.join(os.path.expanduser("~"), ".aws", file_name)
     hdbg.dassert_file_exists(file_name)
+    mtime = os.path.getmtime(file_name)
+    cached = _AWS_CONFIG_CACHE.get(file_name)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     # Read the config.
     config = configparser.RawConfigParser()
     config.read(file_name)
     _LOG.debug("config.sections=%s", config.sections())
+    _AWS_CONFIG_CACHE[file_name] = (mtime, config)
     return config
 
 
@@ -609,7 +682,10 @@ def generate_aws_files(
 #     `AM_AWS_ACCESS_KEY_ID`
 
 
-@functools.lru_cache()
+# Map an AWS profile to its credentials, which are read only once per process.
+_AWS_CREDENTIALS_CACHE: Dict[str, Dict[str, Optional[str]]] = {}
+
+
 def get_aws_credentials(
     aws_profile: str,
 ) -> Dict[str, Optional[str]]:
@@ -617,9 +693,16 @@ def get_aws_credentials(
     Read the AWS credentials for a given profile from `~/.aws` or from env
     vars.
 
+    The credentials are cached, so the client should not modify the returned
+    dictionary.
+
     :return: a dictionary with `access_key_id`, `aws_secret_access_key`,
         `aws_region` and optionally `aws_session_token`
     """
+    cached_result = _AWS_CREDENTIALS_CACHE.get(aws_profile)
+    if cached_result is not None:
+        return cached_result
+    cache_key = aws_profile
     _LOG.debug("Getting credentials for aws_profile='%s'", aws_profile)
     if aws_profile == "__mock__":
         # `mock` profile is artificial construct used only in tests.
@@ -633,12 +716,18 @@ def get_aws_credentials(
         #  that the var is simply the capitalized version of the key.
         "aws_region": f"{profile_prefix}_AWS_DEFAULT_REGION",
     }
+    # Read the env vars once, treating unset vars as empty.
+    env_var_values = {
+        key: os.environ.get(env_var, "")
+        for key, env_var in key_to_env_var.items()
+    }
     # If all the AWS credentials are passed through env vars, they override the
     # config file.
     env_var_override = False
+    # Report the env vars in the warning sorted by name.
     set_env_vars = [
-        (env_var in os.environ and os.environ[env_var] != "")
-        for env_var in sorted(key_to_env_var.values())
+        env_var_values[key] != ""
+        for key, _ in sorted(key_to_env_var.items(), key=lambda kv: kv[1])
     ]
     if any(set_env_vars):
         if not all(set_env_vars):
@@ -650,14 +739,7 @@ def get_aws_credentials(
             env_var_override = True
     if env_var_override:
         _LOG.debug("Using AWS credentials from env vars")
-        # If one variable is defined all should be defined.
-        for key, env_var in key_to_env_var.items():
-            _LOG.debug("'%s' in env vars=%s", env_var, env_var in os.environ)
-            _LOG.debug(
-                "'%s' != ''=%s", env_var, os.environ.get(env_var, None) != ""
-            )
-            hdbg.dassert_in(env_var, os.environ)
-            result[key] = os.environ[env_var]
+        result.update(env_var_values)
         # TODO(gp): We don't pass this through env var for now.
         result["aws_session_token"] = None
     else:
@@ -697,18 +779,30 @@ def get_aws_credentials(
         result[key] = config.get(f"profile {aws_profile}", "region")
     #
     hdbg.dassert_is_subset(key_to_env_var.keys(), result.keys())
+    _AWS_CREDENTIALS_CACHE[cache_key] = result
     return result
 
 
 # ///////////////////////////////////////////////////////////////////////////////
 
 
-def get_s3fs(aws_profile: AwsProfile) -> s3fs.core.S3FileSystem:
+def clear_s3fs_cache() -> None:
+    """
+    Discard the cached `s3fs` objects, e.g., after mocking S3 in a test.
+    """
+    import s3fs
+
+    s3fs.core.S3FileSystem.clear_instance_cache()
+
+
+def get_s3fs(aws_profile: AwsProfile) -> "s3fs.core.S3FileSystem":
     """
     Return a `s3fs` object from a given AWS profile.
 
     :param aws_profile: the name of an AWS profile or a s3fs filesystem
     """
+    import s3fs
+
     if hserver.is_ig_prod():
         # On IG prod machines we let the Docker container infer the right AWS
         # account.
@@ -718,7 +812,11 @@ def get_s3fs(aws_profile: AwsProfile) -> s3fs.core.S3FileSystem:
         if isinstance(aws_profile, str):
             # From https://stackoverflow.com/questions/62562945
             aws_credentials = get_aws_credentials(aws_profile)
-            _LOG.debug("%s", pprint.pformat(aws_credentials))
+            # Don't log the values, since they are secrets.
+            _LOG.debug("Got AWS credentials=%s", list(aws_credentials.keys()))
+            # `fsspec` caches the filesystem instances by their arguments, so
+            # the clients using the same credentials share a filesystem, and
+            # thus its connection pool.
             s3fs_ = s3fs.core.S3FileSystem(
                 anon=False,
                 key=aws_credentials["aws_access_key_id"],
@@ -1,4 +1,5 @@
 import os
+import unittest.mock as umock
 from typing import Tuple
 
 import pytest
@@ -89,6 +90,29 @@ class TestToFileAndFromFile1(hmoto.S3Mock_TestCase):
         self.assert_equal(actual, expected)
 
 
+@pytest.mark.skipif(
+    not henv.execute_repo_config_code("is_CK_S3_available()"),
+    reason="Run only if CK S3 is available",
+)
+class TestParallelGet1(hmoto.S3Mock_TestCase):
+    def test1(self) -> None:
+        """
+        Verify that a file read in parts matches the original content.
+        """
+        # Prepare inputs.
+        file_content = "line_mock1\nline_mock2\nline_mock3"
+        moto_s3fs = hs3.get_s3fs(self.mock_aws_profile)
+        s3_path = f"s3://{self.bucket_name}/mock.txt"
+        hs3.to_file(file_content, s3_path, aws_profile=moto_s3fs)
+        # Read file with parts smaller than the file.
+        actual = hs3.parallel_get(
+            s3_path, moto_s3fs, part_size=4, num_threads=2
+        ).decode()
+        # Check output.
+        expected = hs3.from_file(s3_path, aws_profile=moto_s3fs)
+        self.assert_equal(actual, expected)
+
+
 @pytest.mark.skipif(
     not henv.execute_repo_config_code("is_CK_S3_available()"),
     reason="Run only if CK S3 is available",
@@ -331,4 +355,24 @@ class TestGenerateAwsFiles(hunitest.TestCase):
         [profile test]
         region=test_default_region
         """
-        self.helper(file_name, expected)
\ No newline at end of file
+        self.helper(file_name, expected)
+
+
+class Test_get_aws_config(hunitest.TestCase):
+    def test1(self) -> None:
+        """
+        Check that the cached config is re-parsed after the file changes.
+        """
+        home_dir = self.get_scratch_space()
+        file_name = os.path.join(home_dir, ".aws", "credentials")
+        hio.to_file(file_name, "[am]\naws_s3_bucket=bucket1")
+        with umock.patch.dict(os.environ, {"HOME": home_dir}):
+            config = hs3._get_aws_config("credentials")
+            self.assert_equal(config.get("am", "aws_s3_bucket"), "bucket1")
+            # Change the file and bump its modification time, since the
+            # resolution of the file system clock can be coarse.
+            hio.to_file(file_name, "[am]\naws_s3_bucket=bucket2")
+            mtime = os.path.getmtime(file_name) + 10
+            os.utime(file_name, (mtime, mtime))
+            config = hs3._get_aws_config("credentials")
+        self.assert_equal(config.get("am", "aws_s3_bucket"), "bucket2")
@@ -1,5 +1,8 @@
 import logging
 import os
+import unittest.mock as umock
+
+import s3fs
 
 import helpers.hs3 as hs3
 import helpers.hunit_test as hunitest
@@ -87,4 +90,44 @@ class Test_s3_1(hunitest.TestCase):
         _LOG.debug("file_path=%s", file_path)
         act = s3fs.exists(file_path)
         exp = True
-        self.assertEqual(act, exp)
\ No newline at end of file
+        self.assertEqual(act, exp)
+
+
+class Test_parallel_get1(hunitest.TestCase):
+    def test1(self) -> None:
+        """
+        Verify that a file read in parts matches the original content.
+        """
+        content = bytes(range(256)) * 4
+        file_name = "s3://mock_bucket/mock.bin"
+        # Mock the S3 filesystem serving `content` through the `fsspec` API.
+        s3fs_ = umock.create_autospec(s3fs.S3FileSystem, instance=True)
+        s3fs_.info.return_value = {"size": len(content)}
+        s3fs_.cat_file.side_effect = lambda path, start, end: content[
+            start:end
+        ]
+        actual = hs3.parallel_get(file_name, s3fs_, part_size=100, num_threads=3)
+        # Check output.
+        self.assertEqual(bytes(actual), content)
+        # Each part is requested once.
+        self.assertEqual(s3fs_.cat_file.call_count, 11)
+
+
+class Test_get_s3fs1(hunitest.TestCase):
+    def test1(self) -> None:
+        """
+        Verify that the filesystem is reused until the cache is cleared.
+        """
+        env_vars = {
+            "MOCK_AWS_ACCESS_KEY_ID": "mock_key_id",
+            "MOCK_AWS_SECRET_ACCESS_KEY": "mock_secret_access_key",
+            "MOCK_AWS_DEFAULT_REGION": "us-east-1",
+        }
+        with umock.patch.dict(os.environ, env_vars):
+            s3fs1 = hs3.get_s3fs("__mock__")
+            s3fs2 = hs3.get_s3fs("__mock__")
+            self.assertIs(s3fs1, s3fs2)
+            # Clearing the cache creates a new filesystem.
+            hs3.clear_s3fs_cache()
+            s3fs3 = hs3.get_s3fs("__mock__")
+        self.assertIsNot(s3fs1, s3fs3)
@@ -15,6 +15,9 @@ class FilePathGenerator(abc.ABC):
     (e.g., S3).
     """
 
+    # Generators hold no per-instance state.
+    __slots__ = ()
+
     # TODO(gp): Do we really want to make it explicit?
     # No one is interested in this file except SymbolUniverse class.
     @staticmethod
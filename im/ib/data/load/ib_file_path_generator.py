@@ -25,6 +25,8 @@ class IbFilePathGenerator(imcdlfpage.FilePathGenerator):
     File path is: <symbol>_<frequency>.<extension>
     """
 
+    __slots__ = ()
+
     FREQ_PATH_MAPPING = {
         imcodatyp.Frequency.Daily: "daily",
         imcodatyp.Frequency.Hourly: "hourly",
@@ -6,8 +6,7 @@ import im.kibot.data.load.kibot_file_path_generator as imkdlkfpge
 
 # TODO(*): -> kibot_file_path_generator.py
 
-import os
-from typing import Optional, cast
+from typing import Dict, List, Optional, Sequence, Tuple, cast
 
 import helpers.hdbg as hdbg
 import im.common.data.load.file_path_generator as imcdlfpage
@@ -16,6 +15,8 @@ import im.kibot.data.config as imkidacon
 
 
 class KibotFilePathGenerator(imcdlfpage.FilePathGenerator):
+    __slots__ = ()
+
     FREQ_PATH_MAPPING = {
         imcodatyp.Frequency.Daily: "daily",
         imcodatyp.Frequency.Minutely: "1min",
@@ -27,6 +28,13 @@ class KibotFilePathGenerator(imcdlfpage.FilePathGenerator):
         imcodatyp.ContractType.Expiry: "",
     }
 
+    CONTRACT_PATH_MODIFIER = {
+        contract_type: f"_{contract_path}contracts_"
+        for contract_type, contract_path in CONTRACT_PATH_MAPPING.items()
+    }
+
+    UNADJUSTED_MODIFIER = {True: "unadjusted_", False: ""}
+
     ASSET_TYPE_PREFIX = {
         imcodatyp.AssetClass.ETFs: "all_etfs_",
         imcodatyp.AssetClass.Stocks: "all_stocks_",
@@ -35,6 +43,19 @@ class KibotFilePathGenerator(imcdlfpage.FilePathGenerator):
         imcodatyp.AssetClass.SP500: "sp_500_",
     }
 
+    # Map the file path options to the parts of the path before and after the
+    # symbol, which are computed once per combination of options.
+    _PREFIX_AND_SUFFIX_CACHE: Dict[
+        Tuple[
+            imcodatyp.Frequency,
+            imcodatyp.AssetClass,
+            Optional[imcodatyp.ContractType],
+            Optional[bool],
+            imcodatyp.Extension,
+        ],
+        Tuple[str, str],
+    ] = {}
+
     @staticmethod
     def get_latest_symbols_file() -> str:
         """
@@ -60,6 +81,82 @@ class KibotFilePathGenerator(imcdlfpage.FilePathGenerator):
 
         :return: path to the file
         """
+        prefix, suffix = self._get_prefix_and_suffix(
+            frequency=frequency,
+            asset_class=asset_class,
+            contract_type=contract_type,
+            unadjusted=unadjusted,
+            ext=ext,
+        )
+        file_path = prefix + symbol + suffix
+        return file_path
+
+    def generate_file_paths(
+        self,
+        symbols: Sequence[str],
+        frequency: imcodatyp.Frequency,
+        asset_class: imcodatyp.AssetClass = imcodatyp.AssetClass.Futures,
+        contract_type: Optional[imcodatyp.ContractType] = None,
+        unadjusted: Optional[bool] = None,
+        ext: imcodatyp.Extension = imcodatyp.Extension.Parquet,
+    ) -> List[str]:
+        """
+        Get the paths to the Kibot datasets on S3 for multiple symbols.
+
+        Parameters as in `generate_file_path()`.
+
+        :return: paths to the files, in the same order as `symbols`
+        """
+        prefix, suffix = self._get_prefix_and_suffix(
+            frequency=frequency,
+            asset_class=asset_class,
+            contract_type=contract_type,
+            unadjusted=unadjusted,
+            ext=ext,
+        )
+        file_paths = [prefix + symbol + suffix for symbol in symbols]
+        return file_paths
+
+    def _get_prefix_and_suffix(
+        self,
+        frequency: imcodatyp.Frequency,
+        asset_class: imcodatyp.AssetClass,
+        contract_type: Optional[imcodatyp.ContractType],
+        unadjusted: Optional[bool],
+        ext: imcodatyp.Extension,
+    ) -> Tuple[str, str]:
+        """
+        Return the parts of the file path before and after the symbol, caching
+        them.
+        """
+        key = (frequency, asset_class, contract_type, unadjusted, ext)
+        prefix_and_suffix = self._PREFIX_AND_SUFFIX_CACHE.get(key)
+        if prefix_and_suffix is None:
+            prefix_and_suffix = self._generate_prefix_and_suffix(
+                frequency=frequency,
+                asset_class=asset_class,
+                contract_type=contract_type,
+                unadjusted=unadjusted,
+                ext=ext,
+            )
+            self._PREFIX_AND_SUFFIX_CACHE[key] = prefix_and_suffix
+        return prefix_and_suffix
+
+    def _generate_prefix_and_suffix(
+        self,
+        frequency: imcodatyp.Frequency,
+        asset_class: imcodatyp.AssetClass,
+        contract_type: Optional[imcodatyp.ContractType],
+        unadjusted: Optional[bool],
+        ext: imcodatyp.Extension,
+    ) -> Tuple[str, str]:
+        """
+        Generate the parts of the file path before and after the symbol.
+
+        Parameters as in `generate_file_path()`.
+
+        :return: the path prefix, ending with a separator, and the file suffix
+        """
         freq_path = self.FREQ_PATH_MAPPING[frequency]
         asset_class_prefix = self.ASSET_TYPE_PREFIX[asset_class]
         modifier = self._generate_modifier(
@@ -68,28 +165,27 @@ class KibotFilePathGenerator(imcdlfpage.FilePathGenerator):
             unadjusted=unadjusted,
         )
         dir_name = f"{asset_class_prefix}{modifier}{freq_path}"
-        file_path = os.path.join(dir_name, symbol)
+        suffix = ""
         if ext == imcodatyp.Extension.Parquet:
             # Parquet files are located in `pq/` subdirectory.
-            file_path = os.path.join("pq", file_path)
-            file_path += ".pq"
+            dir_name = f"pq/{dir_name}"
+            suffix = ".pq"
         elif ext == imcodatyp.Extension.CSV:
-            file_path += ".csv.gz"
+            suffix = ".csv.gz"
         # TODO(amr): should we allow pointing to a local file here?
         # or rename the method to `generate_s3_path`?
-        file_path = os.path.join(imkidacon.S3_PREFIX, file_path)
-        return file_path
+        # S3 paths always use `/` as separator, independently of the OS.
+        hdbg.dassert(not imkidacon.S3_PREFIX.endswith("/"))
+        prefix = f"{imkidacon.S3_PREFIX}/{dir_name}/"
+        return prefix, suffix
 
-    @staticmethod
-    def _generate_unadjusted_modifier(unadjusted: bool) -> str:
-        adjusted_modifier = "unadjusted_" if unadjusted else ""
-        return adjusted_modifier
+    def _generate_unadjusted_modifier(self, unadjusted: bool) -> str:
+        return self.UNADJUSTED_MODIFIER[bool(unadjusted)]
 
     def _generate_contract_path_modifier(
         self, contract_type: imcodatyp.ContractType
     ) -> str:
-        contract_path = self.CONTRACT_PATH_MAPPING[contract_type]
-        return f"_{contract_path}contracts_"
+        return self.CONTRACT_PATH_MODIFIER[contract_type]
 
     def _generate_modifier(
         self,
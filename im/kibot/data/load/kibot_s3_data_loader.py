@@ -21,6 +21,11 @@ _LOG = logging.getLogger(__name__)
 
 
 class KibotS3DataLoader(imcdladalo.AbstractS3DataLoader):
+    def __init__(self) -> None:
+        super().__init__()
+        # The generator holds no state, so a single instance serves all reads.
+        self._file_path_generator = imkdlkfpge.KibotFilePathGenerator()
+
     def read_data(
         self,
         exchange: str,
@@ -189,7 +194,7 @@ class KibotS3DataLoader(imcdladalo.AbstractS3DataLoader):
         start_ts: Optional[pd.Timestamp] = None,
         end_ts: Optional[pd.Timestamp] = None,
     ) -> pd.DataFrame:
-        file_path = imkdlkfpge.KibotFilePathGenerator().generate_file_path(
+        file_path = self._file_path_generator.generate_file_path(
             symbol=symbol,
             asset_class=asset_class,
             frequency=frequency,
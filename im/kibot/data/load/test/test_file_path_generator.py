@@ -170,6 +170,24 @@ class TestFilePathGenerator(hunitest.TestCase):
         expected_file_path = "sp_500_unadjusted_tick/TEST.csv.gz"
         self._assert_file_path(args=args, expected_file_path=expected_file_path)
 
+    def test15(self) -> None:
+        """
+        Test generating file names for multiple symbols at once.
+        """
+        symbols = ["TEST1", "TEST2"]
+        args = dict(
+            asset_class=imcodatyp.AssetClass.Futures,
+            contract_type=imcodatyp.ContractType.Continuous,
+            frequency=imcodatyp.Frequency.Daily,
+            ext=imcodatyp.Extension.CSV,
+        )
+        generator = imkdlkfpge.KibotFilePathGenerator()
+        actual = generator.generate_file_paths(symbols, **args)
+        expected = [
+            generator.generate_file_path(symbol, **args) for symbol in symbols
+        ]
+        self.assertEqual(actual, expected)
+
     def _assert_file_path(self, args: dict, expected_file_path: str) -> None:
         generator = imkdlkfpge.KibotFilePathGenerator()
         actual = generator.generate_file_path(**args)